@@ -0,0 +1,40 @@
+"""
+API dependencies
+
+Repository providers injected into route handlers with FastAPI's Depends,
+so tests can swap them through app.dependency_overrides.
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..core.repository import ProductRepository, ScraperRunRepository
+
+
+def get_product_repository(db: Session = Depends(get_db)) -> ProductRepository:
+    """
+    Provide a product repository bound to the request's session
+
+    Args:
+        db: Database session
+
+    Returns:
+        ProductRepository instance
+    """
+    return ProductRepository(db)
+
+
+def get_scraper_run_repository(
+    db: Session = Depends(get_db),
+) -> ScraperRunRepository:
+    """
+    Provide a scraper run repository bound to the request's session
+
+    Args:
+        db: Database session
+
+    Returns:
+        ScraperRunRepository instance
+    """
+    return ScraperRunRepository(db)
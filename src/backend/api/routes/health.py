@@ -5,10 +5,9 @@ Provides application health and status information.
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 from datetime import datetime
 
-from ...core.database import get_db
+from ..dependencies import get_product_repository
 from ...core.repository import ProductRepository
 from ....utils.logger import get_logger
 
@@ -32,7 +31,9 @@ async def health_check():
 
 
 @router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check(
+    repo: ProductRepository = Depends(get_product_repository),
+):
     """
     Detailed health check
 
@@ -40,7 +41,6 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     """
     try:
         # Check database
-        repo = ProductRepository(db)
         stats = repo.get_stats()
 
         return {
@@ -5,18 +5,34 @@ Endpoints for querying and managing product data.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
-from ...core.database import get_db
+from ..dependencies import get_product_repository
 from ...core.repository import ProductRepository
-from ...core.models import ProductResponse, ProductSearchQuery, ChipBrand, Store
+from ...core.models import (
+    ProductInDB,
+    ProductResponse,
+    ProductSearchQuery,
+    ChipBrand,
+    Store,
+)
 from ....utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Serializes straight to JSON bytes in pydantic-core; returning a Response
+# skips FastAPI's response_model re-validation and jsonable_encoder pass
+_PRODUCT_LIST = TypeAdapter(List[ProductResponse])
+
+
+def _products_response(products: List[ProductInDB]) -> Response:
+    """Render products as a JSON list of ProductResponse"""
+    body = _PRODUCT_LIST.dump_json([ProductResponse.from_db_model(p) for p in products])
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/", response_model=List[ProductResponse])
 async def list_products(
@@ -28,7 +44,7 @@ async def list_products(
     store: Optional[Store] = None,
     min_price: Optional[float] = Query(default=None, ge=0),
     max_price: Optional[float] = Query(default=None, ge=0),
-    db: Session = Depends(get_db),
+    repo: ProductRepository = Depends(get_product_repository),
 ):
     """
     List products with pagination and filters
@@ -46,8 +62,6 @@ async def list_products(
     Returns:
         List of products
     """
-    repo = ProductRepository(db)
-
     query = ProductSearchQuery(
         limit=limit,
         offset=offset,
@@ -63,7 +77,7 @@ async def list_products(
 
     logger.info("products_listed", count=len(products), limit=limit, offset=offset)
 
-    return [ProductResponse.from_db_model(p) for p in products]
+    return _products_response(products)
 
 
 @router.get("/search", response_model=List[ProductResponse])
@@ -78,7 +92,7 @@ async def search_products(
     offset: int = Query(default=0, ge=0),
     sort_by: str = Query(default="price", pattern="^(price|date|title)$"),
     sort_order: str = Query(default="asc", pattern="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    repo: ProductRepository = Depends(get_product_repository),
 ):
     """
     Search products with filters
@@ -98,8 +112,6 @@ async def search_products(
     Returns:
         List of matching products
     """
-    repo = ProductRepository(db)
-
     search_query = ProductSearchQuery(
         query=query,
         chip_brand=chip_brand,
@@ -129,14 +141,14 @@ async def search_products(
         count=len(products),
     )
 
-    return [ProductResponse.from_db_model(p) for p in products]
+    return _products_response(products)
 
 
 @router.get("/best-deals", response_model=List[ProductResponse])
 async def get_best_deals(
     limit: int = Query(default=10, ge=1, le=100),
     chip_brand: Optional[ChipBrand] = None,
-    db: Session = Depends(get_db),
+    repo: ProductRepository = Depends(get_product_repository),
 ):
     """
     Get best deals (lowest prices)
@@ -148,8 +160,6 @@ async def get_best_deals(
     Returns:
         List of products with best prices
     """
-    repo = ProductRepository(db)
-
     products = repo.get_best_deals(limit=limit, chip_brand=chip_brand)
 
     logger.info(
@@ -159,11 +169,13 @@ async def get_best_deals(
         count=len(products),
     )
 
-    return [ProductResponse.from_db_model(p) for p in products]
+    return _products_response(products)
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: int, db: Session = Depends(get_db)):
+async def get_product(
+    product_id: int, repo: ProductRepository = Depends(get_product_repository)
+):
     """
     Get product by ID
 
@@ -176,8 +188,6 @@ async def get_product(product_id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if product not found
     """
-    repo = ProductRepository(db)
-
     product = repo.get_by_id(product_id)
 
     if not product:
@@ -188,19 +198,20 @@ async def get_product(product_id: int, db: Session = Depends(get_db)):
 
     logger.info("product_retrieved", product_id=product_id)
 
-    return ProductResponse.from_db_model(product)
+    return Response(
+        content=ProductResponse.from_db_model(product).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/stats/overview")
-async def get_stats(db: Session = Depends(get_db)):
+async def get_stats(repo: ProductRepository = Depends(get_product_repository)):
     """
     Get database statistics
 
     Returns:
         Statistics about products in database
     """
-    repo = ProductRepository(db)
-
     stats = repo.get_stats()
 
     logger.info("stats_retrieved")
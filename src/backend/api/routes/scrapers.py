@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+from ..dependencies import get_scraper_run_repository
 from ...core.database import get_db, get_db_session
 from ...core.repository import ScraperRunRepository
 from ...core.models import (
@@ -113,9 +114,11 @@ async def get_scraper_status():
 
 
 @router.get("/history")
-async def get_recent_runs(limit: int = 10, db: Session = Depends(get_db)):
+async def get_recent_runs(
+    limit: int = 10,
+    repo: ScraperRunRepository = Depends(get_scraper_run_repository),
+):
     """Get recent scraper runs"""
-    repo = ScraperRunRepository(db)
     runs = repo.get_recent_runs(limit)
 
     # Convert SQLAlchemy models to dicts to avoid recursion
@@ -143,7 +146,9 @@ async def get_recent_runs(limit: int = 10, db: Session = Depends(get_db)):
 
 
 @router.get("/metrics")
-async def get_run_stats(days: int = 7, db: Session = Depends(get_db)):
+async def get_run_stats(
+    days: int = 7,
+    repo: ScraperRunRepository = Depends(get_scraper_run_repository),
+):
     """Get scraper run statistics"""
-    repo = ScraperRunRepository(db)
     return repo.get_run_stats(days)
@@ -8,8 +8,9 @@ from contextlib import contextmanager
 from typing import Generator
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
 from .config import get_config
 from .database_models import Base
@@ -37,8 +38,8 @@ def get_engine() -> Engine:
 
         logger.info("creating_database_engine", url=config.database.url)
 
-        # Build engine kwargs — SQLite uses SingletonThreadPool
-        # which does not support pool_size / max_overflow
+        # Build engine kwargs — SQLite pools do not support
+        # pool_size / max_overflow
         engine_kwargs = {
             "echo": config.database.echo,
             "pool_pre_ping": True,
@@ -47,6 +48,11 @@ def get_engine() -> Engine:
         if "sqlite" not in config.database.url:
             engine_kwargs["pool_size"] = config.database.pool_size
             engine_kwargs["max_overflow"] = config.database.max_overflow
+        elif make_url(config.database.url).database in (None, "", ":memory:"):
+            # In-memory SQLite lives inside one connection: share it across
+            # threads so request handlers see the same database
+            engine_kwargs["poolclass"] = StaticPool
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
 
         _engine = create_engine(config.database.url, **engine_kwargs)
 
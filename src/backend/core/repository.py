@@ -31,6 +31,9 @@ logger = get_logger(__name__)
 class ProductRepository:
     """Repository for Product database operations"""
 
+    # Stay well below SQLite's bound-parameter limit in IN (...) lookups
+    URL_LOOKUP_CHUNK = 500
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -51,14 +54,7 @@ class ProductRepository:
 
         if existing:
             # Update existing product
-            existing.title = product.title
-            existing.price_raw = product.price.raw
-            existing.price_value = float(product.price.value)
-            existing.chip_brand = product.chip_brand.value
-            existing.manufacturer = product.manufacturer
-            existing.model = product.model
-            existing.scraped_at = product.scraped_at
-            existing.updated_at = datetime.now()
+            self._apply_update(existing, product)
 
             self.session.flush()
             logger.debug(
@@ -68,17 +64,7 @@ class ProductRepository:
             return self._to_product_in_db(existing)
         else:
             # Create new product
-            db_product = Product(
-                title=product.title,
-                price_raw=product.price.raw,
-                price_value=float(product.price.value),
-                chip_brand=product.chip_brand.value,
-                manufacturer=product.manufacturer,
-                model=product.model,
-                url=str(product.url),
-                store=product.store.value,
-                scraped_at=product.scraped_at,
-            )
+            db_product = self._to_db_model(product)
 
             self.session.add(db_product)
             self.session.flush()
@@ -89,6 +75,53 @@ class ProductRepository:
 
             return self._to_product_in_db(db_product)
 
+    def create_many(self, products: List[EnrichedProduct]) -> List[ProductInDB]:
+        """
+        Create or update many products with one lookup and one flush
+
+        Same semantics as calling create() for each product in order: a URL
+        already stored (or repeated later in the batch) updates that row.
+
+        Args:
+            products: EnrichedProducts to save
+
+        Returns:
+            List of ProductInDB, in input order (entries sharing a URL all
+            reflect the row's final state)
+        """
+        urls = list({str(product.url) for product in products})
+        by_url = {}
+        for start in range(0, len(urls), self.URL_LOOKUP_CHUNK):
+            chunk = urls[start : start + self.URL_LOOKUP_CHUNK]
+            for db_product in self.session.query(Product).filter(
+                Product.url.in_(chunk)
+            ):
+                by_url[db_product.url] = db_product
+
+        saved = []
+        new_products = []
+        for product in products:
+            url = str(product.url)
+            db_product = by_url.get(url)
+            if db_product is not None:
+                self._apply_update(db_product, product)
+            else:
+                db_product = by_url[url] = self._to_db_model(product)
+                new_products.append(db_product)
+            saved.append(db_product)
+
+        self.session.add_all(new_products)
+        self.session.flush()
+
+        logger.debug(
+            "products_created",
+            count=len(saved),
+            created=len(new_products),
+            updated=len(saved) - len(new_products),
+        )
+
+        return [self._to_product_in_db(db_product) for db_product in saved]
+
     def get_by_id(self, product_id: int) -> Optional[ProductInDB]:
         """Get product by ID"""
         product = self.session.query(Product).filter(Product.id == product_id).first()
@@ -387,6 +420,31 @@ class ProductRepository:
         logger.info("products_exported_json", file=output_file, count=len(products))
         return output_file
 
+    def _to_db_model(self, product: EnrichedProduct) -> Product:
+        """Convert Pydantic model to a new SQLAlchemy model"""
+        return Product(
+            title=product.title,
+            price_raw=product.price.raw,
+            price_value=float(product.price.value),
+            chip_brand=product.chip_brand.value,
+            manufacturer=product.manufacturer,
+            model=product.model,
+            url=str(product.url),
+            store=product.store.value,
+            scraped_at=product.scraped_at,
+        )
+
+    def _apply_update(self, existing: Product, product: EnrichedProduct) -> None:
+        """Copy scraped fields onto an existing SQLAlchemy model"""
+        existing.title = product.title
+        existing.price_raw = product.price.raw
+        existing.price_value = float(product.price.value)
+        existing.chip_brand = product.chip_brand.value
+        existing.manufacturer = product.manufacturer
+        existing.model = product.model
+        existing.scraped_at = product.scraped_at
+        existing.updated_at = datetime.now()
+
     def _to_product_in_db(self, product: Product) -> ProductInDB:
         """Convert SQLAlchemy model to Pydantic model"""
         return ProductInDB(
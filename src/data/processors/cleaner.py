@@ -4,6 +4,7 @@ Data cleaning processor
 Normalizes and cleans product data.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from decimal import Decimal
 import re
@@ -13,6 +14,45 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Common mojibake left by UTF-8 text decoded as Latin-1
+_ENCODING_FIXES = (
+    ("Ã§", "ç"),
+    ("Ã£", "ã"),
+    ("Ã¡", "á"),
+    ("Ã©", "é"),
+    ("Ã­", "í"),
+    ("Ã³", "ó"),
+    ("Ãº", "ú"),
+)
+
+# Standard manufacturer names and the spellings that map to them, checked in
+# order as substrings of the upper-cased name
+_MANUFACTURER_VARIANTS = (
+    ("ASUS", ("ASUS", "AZUS")),
+    ("MSI", ("MSI", "M.S.I")),
+    ("GIGABYTE", ("GIGABYTE", "GIGA BYTE", "GBT")),
+    ("EVGA", ("EVGA", "E.V.G.A")),
+    ("ZOTAC", ("ZOTAC", "ZOTAX")),
+    ("GALAX", ("GALAX", "GALAXY")),
+    ("GAINWARD", ("GAINWARD", "GAIN WARD")),
+    ("PALIT", ("PALIT", "PALLIT")),
+    ("PNY", ("PNY", "P.N.Y")),
+    ("XFX", ("XFX", "X.F.X")),
+)
+
+
+@lru_cache(maxsize=1024)
+def _standardize_manufacturer(manufacturer: str) -> str:
+    """Standardize a manufacturer name (memoized, the same names repeat)"""
+    upper = manufacturer.upper()
+
+    for standard, variants in _MANUFACTURER_VARIANTS:
+        for variant in variants:
+            if variant in upper:
+                return standard
+
+    return manufacturer
+
 
 class DataCleaner:
     """
@@ -42,7 +82,8 @@ class DataCleaner:
         # Ensure value is properly rounded
         cleaned_value = round(float(price.value), 2)
 
-        return Price(
+        # Fields are already typed, so skip re-validating them
+        return Price.model_construct(
             raw=cleaned_raw, value=Decimal(str(cleaned_value)), currency=price.currency
         )
 
@@ -68,17 +109,7 @@ class DataCleaner:
         cleaned = " ".join(text.split())
 
         # Fix common encoding issues
-        replacements = {
-            "Ã§": "ç",
-            "Ã£": "ã",
-            "Ã¡": "á",
-            "Ã©": "é",
-            "Ã­": "í",
-            "Ã³": "ó",
-            "Ãº": "ú",
-        }
-
-        for bad, good in replacements.items():
+        for bad, good in _ENCODING_FIXES:
             cleaned = cleaned.replace(bad, good)
 
         return cleaned
@@ -94,28 +125,7 @@ class DataCleaner:
         Returns:
             Standardized name
         """
-        # Convert to uppercase for comparison
-        upper = manufacturer.upper()
-
-        # Standardization map
-        standards = {
-            "ASUS": ["ASUS", "AZUS"],
-            "MSI": ["MSI", "M.S.I"],
-            "GIGABYTE": ["GIGABYTE", "GIGA BYTE", "GBT"],
-            "EVGA": ["EVGA", "E.V.G.A"],
-            "ZOTAC": ["ZOTAC", "ZOTAX"],
-            "GALAX": ["GALAX", "GALAXY"],
-            "GAINWARD": ["GAINWARD", "GAIN WARD"],
-            "PALIT": ["PALIT", "PALLIT"],
-            "PNY": ["PNY", "P.N.Y"],
-            "XFX": ["XFX", "X.F.X"],
-        }
-
-        for standard, variants in standards.items():
-            if any(variant in upper for variant in variants):
-                return standard
-
-        return manufacturer
+        return _standardize_manufacturer(manufacturer)
 
     @staticmethod
     def clean_product(product: ProductInDB) -> ProductInDB:
@@ -161,6 +171,17 @@ class DataCleaner:
             )
             return product_copy
 
+        if isinstance(product, ProductInDB):
+            # Already validated: copy without a second validation pass. The
+            # URL is kept as is, a parsed HttpUrl has no surrounding spaces.
+            return product.model_copy(
+                update={
+                    "title": cleaned_title,
+                    "price": cleaned_price,
+                    "manufacturer": cleaned_manufacturer,
+                }
+            )
+
         return ProductInDB(
             id=product.id,
             title=cleaned_title,
@@ -188,15 +209,14 @@ class DataCleaner:
         """
         seen_urls = set()
         unique_products = []
-        duplicates_removed = 0
 
         for product in products:
-            if product.url not in seen_urls:
-                seen_urls.add(product.url)
+            url = product.url
+            if url not in seen_urls:
+                seen_urls.add(url)
                 unique_products.append(product)
-            else:
-                duplicates_removed += 1
 
+        duplicates_removed = len(products) - len(unique_products)
         if duplicates_removed > 0:
             logger.info("duplicates_removed", count=duplicates_removed)
 
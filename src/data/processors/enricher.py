@@ -6,7 +6,7 @@ Enriches product data with additional information.
 
 from typing import List
 
-from src.backend.core.models import ProductInDB, RawProduct, EnrichedProduct
+from src.backend.core.models import ProductInDB, RawProduct, EnrichedProduct, ChipBrand
 from src.scrapers.components.product_enricher import ProductEnricher
 from src.utils.logger import get_logger
 
@@ -41,6 +41,13 @@ class DataEnricher:
             raw_product.title, str(raw_product.url)
         )
 
+        return self._build(raw_product, chip_brand, manufacturer, model)
+
+    @staticmethod
+    def _build(
+        raw_product: RawProduct, chip_brand: ChipBrand, manufacturer: str, model: str
+    ) -> EnrichedProduct:
+        """Combine a raw product with its detected metadata"""
         enriched = EnrichedProduct(
             title=raw_product.title,
             price=raw_product.price,
@@ -73,11 +80,17 @@ class DataEnricher:
         """
         logger.info("enriching_batch", count=len(raw_products))
 
+        # Detect in one pass, so repeated titles are only analysed once
+        detected = self.enricher.enrich_batch(
+            [raw.title for raw in raw_products],
+            [str(raw.url) for raw in raw_products],
+        )
+
         enriched_products = []
 
-        for raw in raw_products:
+        for raw, (chip_brand, manufacturer, model) in zip(raw_products, detected):
             try:
-                enriched = self.enrich_product(raw)
+                enriched = self._build(raw, chip_brand, manufacturer, model)
                 enriched_products.append(enriched)
             except Exception as e:
                 logger.error(
@@ -12,6 +12,16 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fields every product must carry, checked in this order
+_REQUIRED_FIELDS = ("title", "price", "url", "store", "chip_brand")
+
+
+def _get_field(obj: Any, name: str) -> Any:
+    """Read a field from a product object or dict"""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
 
 class ValidationError(Exception):
     """Raised when validation fails"""
@@ -115,22 +125,8 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-
-        def _get_field(obj, name):
-            if isinstance(obj, dict):
-                return obj.get(name)
-            return getattr(obj, name, None)
-
-        required_fields = {
-            "title": _get_field(product, "title"),
-            "price": _get_field(product, "price"),
-            "url": _get_field(product, "url"),
-            "store": _get_field(product, "store"),
-            "chip_brand": _get_field(product, "chip_brand"),
-        }
-
-        for field_name, field_value in required_fields.items():
-            if field_value is None:
+        for field_name in _REQUIRED_FIELDS:
+            if _get_field(product, field_name) is None:
                 return False, f"Required field '{field_name}' is None"
 
         return True, None
@@ -150,12 +146,6 @@ class DataValidator:
         Raises:
             ValidationError: If strict=True and validation fails
         """
-
-        def _get_field(obj, name):
-            if isinstance(obj, dict):
-                return obj.get(name)
-            return getattr(obj, name, None)
-
         errors = []
 
         # Validate required fields
@@ -17,6 +17,7 @@ import asyncio
 
 from .models import ScraperConfig, StoreSelectors, ExtractionResult
 from .exceptions import CaptchaDetected, PageLoadError, MaxRetriesExceeded
+from .components.product_enricher import ProductEnricher
 from ..backend.core.models import (
     ScraperMetrics,
     EnrichedProduct,
@@ -27,6 +28,9 @@ from ..backend.core.models import (
 from ..utils.logger import get_logger
 from ..backend.api.websocket.manager import manager
 
+# The enricher holds no state, so every scraper and product can share one
+_enricher = ProductEnricher()
+
 
 class BaseScraper(ABC):
     """
@@ -485,11 +489,9 @@ class BaseScraper(ABC):
             # Enrich and Save to Database
             from ..backend.core.database import get_db_session
             from ..backend.core.repository import ProductRepository
-            from .components.product_enricher import ProductEnricher
             from ..backend.core.models import EnrichedProduct, Price, ChipBrand, Store
 
-            enricher = ProductEnricher()
-            chip, manufact, model = enricher.enrich(result.title, result.url)
+            chip, manufact, model = _enricher.enrich(result.title, result.url)
 
             # Map scraper name to Store enum
             store_name = self.get_store_name()
@@ -13,6 +13,10 @@ from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# "R$ 1.234,56" anywhere in a text
+_PRICE_RE = re.compile(r"R\$\s*[\d.,]+")
+_NUMBER_RE = re.compile(r"\d+")
+
 
 class DataExtractor:
     """
@@ -155,13 +159,13 @@ class DataExtractor:
                 if price_val:
                     return (price_str, price_val)
 
-        # Default pattern: R$ followed by numbers
-        matches = re.findall(r"R\$\s*[\d.,]+", text)
-
-        for match in matches:
-            price_val = DataExtractor.clean_price(match)
+        # Default pattern: R$ followed by numbers, scanned lazily so the
+        # search stops at the first price in range
+        for match in _PRICE_RE.finditer(text):
+            price_str = match.group(0)
+            price_val = DataExtractor.clean_price(price_str)
             if price_val and 100 <= price_val <= 50000:  # Reasonable range
-                return (match, price_val)
+                return (price_str, price_val)
 
         return None
 
@@ -197,5 +201,5 @@ class DataExtractor:
         Returns:
             Integer or None
         """
-        match = re.search(r"\d+", text)
+        match = _NUMBER_RE.search(text)
         return int(match.group(0)) if match else None
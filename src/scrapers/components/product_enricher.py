@@ -5,7 +5,8 @@ Detects chip brand, manufacturer, and model from product titles and URLs.
 """
 
 import re
-from typing import Tuple, Optional
+import sys
+from typing import Dict, List, Optional, Tuple
 
 from ...backend.core.models import ChipBrand
 from ...backend.core.config import KNOWN_MANUFACTURERS
@@ -17,10 +18,11 @@ logger = get_logger(__name__)
 class ChipBrandDetector:
     """Detects GPU chip brand (NVIDIA, AMD, INTEL)"""
 
-    # Keywords for each brand
-    NVIDIA_KEYWORDS = ["GEFORCE", "RTX", "GTX", "NVIDIA"]
-    AMD_KEYWORDS = ["RADEON", "RX", "AMD"]
-    INTEL_KEYWORDS = ["ARC", "INTEL"]
+    # Keywords for each brand (tuples: the lookup table below is built
+    # from them once at import)
+    NVIDIA_KEYWORDS = ("GEFORCE", "RTX", "GTX", "NVIDIA")
+    AMD_KEYWORDS = ("RADEON", "RX", "AMD")
+    INTEL_KEYWORDS = ("ARC", "INTEL")
 
     @staticmethod
     def detect(title: str) -> ChipBrand:
@@ -33,21 +35,7 @@ class ChipBrandDetector:
         Returns:
             ChipBrand enum value
         """
-        title_upper = title.upper()
-
-        # Check NVIDIA
-        if any(keyword in title_upper for keyword in ChipBrandDetector.NVIDIA_KEYWORDS):
-            return ChipBrand.NVIDIA
-
-        # Check AMD
-        if any(keyword in title_upper for keyword in ChipBrandDetector.AMD_KEYWORDS):
-            return ChipBrand.AMD
-
-        # Check Intel
-        if any(keyword in title_upper for keyword in ChipBrandDetector.INTEL_KEYWORDS):
-            return ChipBrand.INTEL
-
-        return ChipBrand.OTHER
+        return _detect_chip(title.upper())
 
 
 class ManufacturerDetector:
@@ -65,25 +53,7 @@ class ManufacturerDetector:
         Returns:
             Manufacturer name or "Genérica/Outra"
         """
-        title_upper = title.upper()
-        url_lower = url.lower()
-
-        # Try title first
-        for manufacturer in KNOWN_MANUFACTURERS:
-            if manufacturer in title_upper:
-                return manufacturer
-
-        # Try URL (pattern: /manufacturer-product or -manufacturer-)
-        if url_lower:
-            for manufacturer in KNOWN_MANUFACTURERS:
-                manufacturer_lower = manufacturer.lower()
-                if (
-                    f"-{manufacturer_lower}-" in url_lower
-                    or f"/{manufacturer_lower}-" in url_lower
-                ):
-                    return manufacturer
-
-        return "Genérica/Outra"
+        return _detect_manufacturer(title.upper(), url)
 
 
 class ModelExtractor:
@@ -105,46 +75,106 @@ class ModelExtractor:
         Returns:
             Model string (e.g., "RTX 4090", "RX 7900 XT") or "Desconhecido"
         """
-        title_upper = title.upper()
+        return _extract_model(title.upper())
+
+
+# Lookup tables are built once at import. Each keyword check is a C-level
+# substring search, which beats a single Python regex pass over the title
+# for keyword sets this small. Order encodes priority: NVIDIA wins over AMD,
+# AMD over Intel, and earlier KNOWN_MANUFACTURERS entries win.
+_CHIP_KEYWORDS = (
+    *((keyword, ChipBrand.NVIDIA) for keyword in ChipBrandDetector.NVIDIA_KEYWORDS),
+    *((keyword, ChipBrand.AMD) for keyword in ChipBrandDetector.AMD_KEYWORDS),
+    *((keyword, ChipBrand.INTEL) for keyword in ChipBrandDetector.INTEL_KEYWORDS),
+)
+# One snapshot of KNOWN_MANUFACTURERS serves both the title and URL scans,
+# each name paired with its URL hints (-name- and /name-)
+_MANUFACTURERS = tuple(
+    (manufacturer, f"-{manufacturer.lower()}-", f"/{manufacturer.lower()}-")
+    for manufacturer in KNOWN_MANUFACTURERS
+)
+_NVIDIA_MODEL_PREFIXES = ("RTX ", "GTX ")
+
+# Each pattern is paired with a literal every one of its matches contains
+# (RTX and GTX share "TX"). The substring check rejects most titles before
+# the regex engine has to try the pattern at every position.
+_MODEL_PATTERNS = (
+    ("TX", re.compile(ModelExtractor.NVIDIA_PATTERN)),
+    ("RX", re.compile(ModelExtractor.AMD_PATTERN)),
+    ("ARC", re.compile(ModelExtractor.INTEL_PATTERN)),
+)
+
+# Fallback results, interned like the model names so every product shares
+# one string object per distinct value
+_GENERIC_MANUFACTURER = sys.intern("Genérica/Outra")
+_UNKNOWN_MODEL = sys.intern("Desconhecido")
+
+
+def _detect_chip(title_upper: str) -> ChipBrand:
+    """Detect chip brand from an already upper-cased title"""
+    for keyword, brand in _CHIP_KEYWORDS:
+        if keyword in title_upper:
+            return brand
+
+    return ChipBrand.OTHER
+
+
+def _detect_manufacturer(title_upper: str, url: str) -> str:
+    """Detect manufacturer from an already upper-cased title and the URL"""
+    # Try title first
+    for manufacturer, _, _ in _MANUFACTURERS:
+        if manufacturer in title_upper:
+            return manufacturer
+
+    # Try URL (pattern: /manufacturer-product or -manufacturer-)
+    if url:
+        url_lower = url.lower()
+        for manufacturer, dashed, slashed in _MANUFACTURERS:
+            if dashed in url_lower or slashed in url_lower:
+                return manufacturer
 
-        # Try NVIDIA pattern
-        match = re.search(ModelExtractor.NVIDIA_PATTERN, title_upper)
-        if match:
-            series, number, suffix = match.groups()
-            model = f"{series} {number}"
-            if suffix:
-                model += f" {suffix}"
-            return model
-
-        # Try AMD pattern
-        match = re.search(ModelExtractor.AMD_PATTERN, title_upper)
-        if match:
-            series, number, suffix = match.groups()
-            model = f"{series} {number}"
-            if suffix:
-                model += f" {suffix}"
-            return model
-
-        # Try Intel pattern
-        match = re.search(ModelExtractor.INTEL_PATTERN, title_upper)
+    return _GENERIC_MANUFACTURER
+
+
+def _extract_model(title_upper: str) -> str:
+    """Extract GPU model from an already upper-cased title"""
+    for anchor, pattern in _MODEL_PATTERNS:
+        if anchor not in title_upper:
+            continue
+        match = pattern.search(title_upper)
         if match:
-            series, number = match.groups()
-            return f"{series} {number}"
+            # Series, number and the optional suffix; the same few models
+            # repeat across listings, so keep one shared copy of each
+            return sys.intern(" ".join([part for part in match.groups() if part]))
+
+    return _UNKNOWN_MODEL
 
-        return "Desconhecido"
+
+def _enrich(title: str, url: str) -> Tuple[ChipBrand, str, str]:
+    """Run all detectors over one product"""
+    # Upper-case once and share it across all detectors
+    title_upper = title.upper()
+
+    model = _extract_model(title_upper)
+    if model.startswith(_NVIDIA_MODEL_PREFIXES):
+        # An NVIDIA model contains RTX/GTX, so the chip scan would say so
+        chip_brand = ChipBrand.NVIDIA
+    else:
+        chip_brand = _detect_chip(title_upper)
+    manufacturer = _detect_manufacturer(title_upper, url)
+
+    return (chip_brand, manufacturer, model)
 
 
 class ProductEnricher:
     """
     Complete product enrichment
 
-    Combines all detectors to enrich product data.
+    Combines all detectors to enrich product data. The detectors are
+    stateless, so the enricher holds no state either and is cheap to create.
     """
 
-    def __init__(self):
-        self.chip_detector = ChipBrandDetector()
-        self.manufacturer_detector = ManufacturerDetector()
-        self.model_extractor = ModelExtractor()
+    __slots__ = ()
 
     def enrich(self, title: str, url: str = "") -> Tuple[ChipBrand, str, str]:
         """
@@ -162,9 +192,7 @@ class ProductEnricher:
             >>> enricher.enrich("Placa de Vídeo ASUS ROG RTX 4090")
             (ChipBrand.NVIDIA, "ASUS", "RTX 4090")
         """
-        chip_brand = self.chip_detector.detect(title)
-        manufacturer = self.manufacturer_detector.detect(title, url)
-        model = self.model_extractor.extract(title)
+        chip_brand, manufacturer, model = _enrich(title, url)
 
         logger.debug(
             "product_enriched",
@@ -175,3 +203,37 @@ class ProductEnricher:
         )
 
         return (chip_brand, manufacturer, model)
+
+    def enrich_batch(
+        self, titles: List[str], urls: Optional[List[str]] = None
+    ) -> List[Tuple[ChipBrand, str, str]]:
+        """
+        Enrich many products at once
+
+        Listings repeat the same product across pages and stores, so each
+        distinct (title, url) pair is only analysed once per batch.
+
+        Args:
+            titles: Product titles
+            urls: Product URLs, parallel to titles (optional)
+
+        Returns:
+            List of (chip_brand, manufacturer, model) tuples, in input order
+        """
+        if urls is None:
+            urls = [""] * len(titles)
+        elif len(urls) != len(titles):
+            raise ValueError("titles and urls must have the same length")
+
+        seen: Dict[Tuple[str, str], Tuple[ChipBrand, str, str]] = {}
+        results = []
+
+        for key in zip(titles, urls):
+            result = seen.get(key)
+            if result is None:
+                result = seen[key] = _enrich(*key)
+            results.append(result)
+
+        logger.debug("products_enriched", count=len(results), unique=len(seen))
+
+        return results
@@ -4,11 +4,15 @@ Selector caching for performance optimization
 Caches successful selectors to avoid retrying failed ones.
 """
 
+import threading
 from typing import Dict, List, Optional
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Marks a key that is not cached; "" is a valid cached selector
+_MISSING = object()
+
 
 class SelectorCache:
     """
@@ -16,12 +20,20 @@ class SelectorCache:
 
     When multiple selectors are tried, cache the one that works
     to avoid retrying failed selectors on subsequent elements.
+
+    Lookups may be shared between threads: hits read the dict without
+    locking, while misses and writes are serialized so each key is probed
+    once. The hit counter is not locked, so under concurrent use the
+    statistics are approximate and may undercount hits.
     """
 
+    __slots__ = ("_cache", "_hits", "_misses", "_lock")
+
     def __init__(self):
         self._cache: Dict[str, str] = {}
         self._hits = 0
         self._misses = 0
+        self._lock = threading.Lock()
 
     def get(self, key: str, selectors: List[str], test_func=None) -> str:
         """
@@ -35,44 +47,54 @@ class SelectorCache:
         Returns:
             Working selector (either cached or newly found)
         """
-        # Check cache first
-        if key in self._cache:
+        # Check cache first: a hit is one dict lookup, counted in the stats
+        # rather than logged since it happens for every product on a page
+        selector = self._cache.get(key, _MISSING)
+        if selector is not _MISSING:
             self._hits += 1
-            logger.debug("selector_cache_hit", key=key, selector=self._cache[key])
-            return self._cache[key]
+            return selector
 
-        # Cache miss - find working selector
-        self._misses += 1
+        # Cache miss - find working selector. Another thread may have
+        # cached it while we waited for the lock, so look again first.
+        with self._lock:
+            selector = self._cache.get(key, _MISSING)
+            if selector is not _MISSING:
+                self._hits += 1
+                return selector
 
-        if test_func:
-            # Use test function to find working selector
-            for selector in selectors:
-                if test_func(selector):
-                    self._cache[key] = selector
-                    logger.debug("selector_cached", key=key, selector=selector)
-                    return selector
+            self._misses += 1
 
-        # No test function or none worked - return first
-        if selectors:
-            self._cache[key] = selectors[0]
-            return selectors[0]
+            if test_func:
+                # Use test function to find working selector
+                for selector in selectors:
+                    if test_func(selector):
+                        self._cache[key] = selector
+                        logger.debug("selector_cached", key=key, selector=selector)
+                        return selector
 
-        return ""
+            # No test function or none worked - return first
+            if selectors:
+                self._cache[key] = selectors[0]
+                return selectors[0]
+
+            return ""
 
     def set(self, key: str, selector: str) -> None:
         """Manually set a cached selector"""
-        self._cache[key] = selector
+        with self._lock:
+            self._cache[key] = selector
         logger.debug("selector_manually_cached", key=key, selector=selector)
 
     def clear(self) -> None:
         """Clear all cached selectors"""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
         logger.debug("selector_cache_cleared")
 
     def get_stats(self) -> Dict[str, int]:
-        """Get cache statistics"""
+        """Get cache statistics (approximate while other threads call get)"""
         total = self._hits + self._misses
         hit_rate = (self._hits / total * 100) if total > 0 else 0
 
@@ -4,13 +4,91 @@ Price value object - Immutable representation of a monetary value.
 Handles currency, validation, and comparison logic.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
-from typing import Optional
-import re
+from typing import Dict, Optional
 
+# Every character str.isspace() (and so regex \s) accepts; spelled out
+# rather than scanned for at import
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
 
-@dataclass(frozen=True)
+# Deletes currency symbols and whitespace (incl. no-break and thin spaces)
+_STRIP_TABLE = str.maketrans("", "", "R$" + _WHITESPACE)
+
+# Swaps US separators for Brazilian ones (1,234.56 -> 1.234,56)
+_PT_BR_SEPARATORS = str.maketrans(",.", ".,")
+
+# Canonical (upper-cased, interned) form of each currency code seen so far.
+# Only valid codes are stored, so a hit also skips validation.
+_CURRENCY_CODES: Dict[str, str] = {}
+
+
+def _canonical_currency(currency: str) -> str:
+    """
+    Validate a currency code and return its canonical form.
+
+    Args:
+        currency: Currency code as given by the caller
+
+    Returns:
+        Upper-cased, interned currency code
+
+    Raises:
+        ValueError: If the code is empty or not three ASCII letters
+    """
+    canonical = _CURRENCY_CODES.get(currency)
+    if canonical is None:
+        if not currency or not currency.strip():
+            raise ValueError("Currency cannot be empty")
+
+        if len(currency) != 3 or not (currency.isascii() and currency.isalpha()):
+            raise ValueError("Currency must be 3-letter code (e.g., BRL, USD)")
+
+        canonical = _CURRENCY_CODES[currency] = sys.intern(currency.upper())
+
+    return canonical
+
+
+def _to_decimal(value) -> Decimal:
+    """
+    Convert a numeric value to Decimal using the cheapest exact path.
+
+    Integers convert directly. Floats go through their shortest repr so
+    1500.5 becomes Decimal("1500.5") rather than its binary expansion;
+    the C decimal parser is faster here than building a digit tuple.
+    """
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=8192)
+def _format_amount(amount: Decimal, locale: str) -> str:
+    """
+    Format an amount for display, memoized since prices repeat across listings.
+
+    Args:
+        amount: Amount to format
+        locale: Locale for formatting (pt_BR or en_US)
+
+    Returns:
+        Formatted price string
+    """
+    if locale == "pt_BR":
+        # Brazilian format: R$ 1.234,56
+        return f"R$ {amount:,.2f}".translate(_PT_BR_SEPARATORS)
+
+    # US format: $1,234.56
+    return f"${amount:,.2f}"
+
+
+@dataclass(frozen=True, slots=True)
 class Price:
     """
     Price value object representing a monetary amount.
@@ -31,10 +109,15 @@ class Price:
         """Validate price after initialization."""
         # Use object.__setattr__ because dataclass is frozen
         if not isinstance(self.amount, Decimal):
-            object.__setattr__(self, "amount", Decimal(str(self.amount)))
+            object.__setattr__(self, "amount", _to_decimal(self.amount))
 
         self._validate()
 
+        # Currency codes repeat across every price: share one string object
+        currency = _canonical_currency(self.currency)
+        if currency is not self.currency:
+            object.__setattr__(self, "currency", currency)
+
     def _validate(self) -> None:
         """
         Validate price business rules.
@@ -48,11 +131,7 @@ class Price:
         if self.amount == 0:
             raise ValueError("Price amount cannot be zero")
 
-        if not self.currency or not self.currency.strip():
-            raise ValueError("Currency cannot be empty")
-
-        if len(self.currency) != 3:
-            raise ValueError("Currency must be 3-letter code (e.g., BRL, USD)")
+        # The currency code is validated by _canonical_currency
 
     @classmethod
     def from_string(cls, price_str: str, currency: str = "BRL") -> "Price":
@@ -77,28 +156,33 @@ class Price:
         if not price_str or not price_str.strip():
             raise ValueError("Price string cannot be empty")
 
-        # Remove currency symbols and whitespace
-        cleaned = price_str.strip()
-        cleaned = re.sub(r"[R$\s]", "", cleaned)
-
-        # Handle Brazilian format (1.234,56)
-        if "," in cleaned and "." in cleaned:
-            # Check which comes last
-            if cleaned.rindex(",") > cleaned.rindex("."):
-                # Brazilian format: 1.234,56
-                cleaned = cleaned.replace(".", "").replace(",", ".")
-            else:
-                # US format: 1,234.56
-                cleaned = cleaned.replace(",", "")
-        elif "," in cleaned:
-            # Only comma, assume Brazilian format
-            cleaned = cleaned.replace(",", ".")
+        # Remove currency symbols and whitespace in one C-level pass
+        cleaned = price_str.translate(_STRIP_TABLE)
+
+        # The separator seen last is the decimal one
+        last_comma = cleaned.rfind(",")
+        last_dot = cleaned.rfind(".")
+
+        if last_comma > last_dot:
+            # Brazilian format (1.234,56) or comma-only decimals (1234,56)
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+        elif last_comma != -1:
+            # US format: 1,234.56
+            cleaned = cleaned.replace(",", "")
 
         try:
             amount = Decimal(cleaned)
-        except (InvalidOperation, ValueError) as e:
+        except InvalidOperation as e:
             raise ValueError(f"Cannot parse price from '{price_str}': {e}")
 
+        if not amount.is_finite():
+            raise ValueError(f"Cannot parse price from '{price_str}': not a number")
+
+        # Listings repeat the same price text: keep one shared copy
+        # (sys.intern rejects str subclasses such as parser text nodes)
+        if type(price_str) is str:
+            price_str = sys.intern(price_str)
+
         return cls(amount=amount, currency=currency, raw_string=price_str)
 
     @classmethod
@@ -113,7 +197,7 @@ class Price:
         Returns:
             Price value object
         """
-        return cls(amount=Decimal(str(amount)), currency=currency)
+        return cls(amount=_to_decimal(amount), currency=currency)
 
     def to_float(self) -> float:
         """
@@ -134,17 +218,7 @@ class Price:
         Returns:
             Formatted price string
         """
-        if locale == "pt_BR":
-            # Brazilian format: R$ 1.234,56
-            amount_str = (
-                f"{self.amount:,.2f}".replace(",", "X")
-                .replace(".", ",")
-                .replace("X", ".")
-            )
-            return f"R$ {amount_str}"
-        else:
-            # US format: $1,234.56
-            return f"${self.amount:,.2f}"
+        return _format_amount(self.amount, locale)
 
     def __str__(self) -> str:
         """String representation."""
@@ -154,34 +228,47 @@ class Price:
         """Developer representation."""
         return f"Price(amount={self.amount}, currency='{self.currency}')"
 
+    def _check_same_currency(self, other: "Price") -> None:
+        """
+        Ensure two prices can be compared.
+
+        Currency codes are interned, so the comparison operators only call
+        this when the codes are different objects.
+
+        Raises:
+            ValueError: If the currencies differ
+        """
+        if self.currency != other.currency:
+            raise ValueError("Cannot compare prices with different currencies")
+
     def __lt__(self, other: "Price") -> bool:
         """Less than comparison."""
         if not isinstance(other, Price):
             return NotImplemented
-        if self.currency != other.currency:
-            raise ValueError("Cannot compare prices with different currencies")
+        if self.currency is not other.currency:
+            self._check_same_currency(other)
         return self.amount < other.amount
 
     def __le__(self, other: "Price") -> bool:
         """Less than or equal comparison."""
         if not isinstance(other, Price):
             return NotImplemented
-        if self.currency != other.currency:
-            raise ValueError("Cannot compare prices with different currencies")
+        if self.currency is not other.currency:
+            self._check_same_currency(other)
         return self.amount <= other.amount
 
     def __gt__(self, other: "Price") -> bool:
         """Greater than comparison."""
         if not isinstance(other, Price):
             return NotImplemented
-        if self.currency != other.currency:
-            raise ValueError("Cannot compare prices with different currencies")
+        if self.currency is not other.currency:
+            self._check_same_currency(other)
         return self.amount > other.amount
 
     def __ge__(self, other: "Price") -> bool:
         """Greater than or equal comparison."""
         if not isinstance(other, Price):
             return NotImplemented
-        if self.currency != other.currency:
-            raise ValueError("Cannot compare prices with different currencies")
+        if self.currency is not other.currency:
+            self._check_same_currency(other)
         return self.amount >= other.amount
@@ -4,11 +4,11 @@ Selector value objects - CSS selectors for web scraping.
 Immutable representations of CSS selectors with fallback support.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Iterator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Selector:
     """
     Selector value object representing a single CSS selector.
@@ -46,7 +46,7 @@ class Selector:
         return f"Selector('{self.css}')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SelectorSet:
     """
     SelectorSet value object representing multiple selectors with fallback.
@@ -136,6 +136,10 @@ class SelectorSet:
         """Get selector by index."""
         return self.selectors[index]
 
+    def __contains__(self, selector: object) -> bool:
+        """Check membership on the tuple directly instead of via __iter__."""
+        return selector in self.selectors
+
     def __str__(self) -> str:
         """String representation."""
         return f"SelectorSet({len(self.selectors)} selectors)"
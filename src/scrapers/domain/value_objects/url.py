@@ -5,11 +5,69 @@ Handles URL validation and normalization.
 """
 
 from dataclasses import dataclass
-from urllib.parse import urlparse, urlunparse
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """
+    Parse URL once for validation and the domain/path getters.
+
+    ParseResult is an immutable tuple, so cached results are safe to share.
+
+    Args:
+        url: URL to parse
+
+    Returns:
+        Parsed URL components
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """
+    Normalize URL for comparison.
+
+    - Removes trailing slashes
+    - Lowercases scheme and domain
+    - Removes default ports
+    - Removes fragment
+
+    Results are memoized since the same product URLs are seen on every run,
+    and the parse itself is shared with validation through _parse_url.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL
+    """
+    parts = _parse_url(url)
+
+    # Lowercase scheme and netloc
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+
+    # Remove default ports
+    if netloc.endswith(":80") and scheme == "http":
+        netloc = netloc[:-3]
+    elif netloc.endswith(":443") and scheme == "https":
+        netloc = netloc[:-4]
+
+    # Remove trailing slash from path (params are kept apart, as in urlparse)
+    path = parts.path.rstrip("/") or "/"
+    if parts.params:
+        path = f"{path};{parts.params}"
+
+    if parts.query:
+        return f"{scheme}://{netloc}{path}?{parts.query}"
+    return f"{scheme}://{netloc}{path}"
+
+
+@dataclass(frozen=True, slots=True)
 class ProductUrl:
     """
     ProductUrl value object representing a product's web address.
@@ -30,7 +88,7 @@ class ProductUrl:
 
         # Normalize URL
         if self.normalized is None:
-            object.__setattr__(self, "normalized", self._normalize(self.url))
+            object.__setattr__(self, "normalized", _normalize_url(self.url))
 
     def _validate(self) -> None:
         """
@@ -43,7 +101,7 @@ class ProductUrl:
             raise ValueError("URL cannot be empty")
 
         # Parse URL
-        parsed = urlparse(self.url)
+        parsed = _parse_url(self.url)
 
         if not parsed.scheme:
             raise ValueError("URL must have a scheme (http/https)")
@@ -54,45 +112,6 @@ class ProductUrl:
         if not parsed.netloc:
             raise ValueError("URL must have a domain")
 
-    def _normalize(self, url: str) -> str:
-        """
-        Normalize URL for comparison.
-
-        - Removes trailing slashes
-        - Lowercases scheme and domain
-        - Removes default ports
-        - Sorts query parameters
-
-        Args:
-            url: URL to normalize
-
-        Returns:
-            Normalized URL
-        """
-        parsed = urlparse(url)
-
-        # Lowercase scheme and netloc
-        scheme = parsed.scheme.lower()
-        netloc = parsed.netloc.lower()
-
-        # Remove default ports
-        if netloc.endswith(":80") and scheme == "http":
-            netloc = netloc[:-3]
-        elif netloc.endswith(":443") and scheme == "https":
-            netloc = netloc[:-4]
-
-        # Remove trailing slash from path
-        path = parsed.path.rstrip("/")
-        if not path:
-            path = "/"
-
-        # Reconstruct URL
-        normalized = urlunparse(
-            (scheme, netloc, path, parsed.params, parsed.query, "")  # Remove fragment
-        )
-
-        return normalized
-
     def get_domain(self) -> str:
         """
         Extract domain from URL.
@@ -100,8 +119,7 @@ class ProductUrl:
         Returns:
             Domain name
         """
-        parsed = urlparse(self.url)
-        return parsed.netloc
+        return _parse_url(self.url).netloc
 
     def get_path(self) -> str:
         """
@@ -110,8 +128,7 @@ class ProductUrl:
         Returns:
             URL path
         """
-        parsed = urlparse(self.url)
-        return parsed.path
+        return _parse_url(self.url).path
 
     def is_same_domain(self, other: "ProductUrl") -> bool:
         """
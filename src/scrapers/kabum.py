@@ -5,6 +5,9 @@ from .base import BaseScraper
 from .models import StoreSelectors, SelectorSet, ExtractionResult
 from src.backend.core.models import Store
 
+# "R$ 1.234,56" -> "1.234,56"
+_PRICE_RE = re.compile(r"R\$\s*([\d.,]+)")
+
 
 class KabumScraper(BaseScraper):
     def get_store_name(self) -> str:
@@ -108,8 +111,6 @@ class KabumScraper(BaseScraper):
     async def extract_price(self, element) -> Optional[tuple[str, float]]:
         # This is handled by BaseScraper's default flow via _extract_text using selectors
         # But BaseScraper template calls self.extract_price(element) to get the tuple
-        import re
-
         selectors = self.get_selectors()
         for selector in selectors.price:
             try:
@@ -133,7 +134,7 @@ class KabumScraper(BaseScraper):
         # Fallback regex if needed, similar to legacy
         try:
             text = await element.inner_text()
-            matches = re.findall(r"R\$\s*([\d.,]+)", text)
+            matches = _PRICE_RE.findall(text)
             if matches:
                 clean = matches[0].replace(".", "").replace(",", ".")
                 return f"R$ {matches[0]}", float(clean)
@@ -3,6 +3,10 @@ from .base import BaseScraper
 from .models import StoreSelectors, SelectorSet
 import asyncio
 import random
+import re
+
+# "R$ 1.234,56" -> "1.234,56"
+_PRICE_RE = re.compile(r"R\$\s*([\d\.,]+)")
 
 
 class PichauScraper(BaseScraper):
@@ -75,10 +79,8 @@ class PichauScraper(BaseScraper):
                 if count > 0:
                     text = await element.inner_text()
 
-                    import re
-
                     # Find all R$ like values
-                    matches = re.findall(r"R\$\s*([\d\.,]+)", text)
+                    matches = _PRICE_RE.findall(text)
                     if matches:
                         valid_values = []
                         for m in matches:
@@ -3,6 +3,9 @@ from .base import BaseScraper
 from .models import StoreSelectors, SelectorSet
 import asyncio
 import random
+import re
+
+_NUMBER_RE = re.compile(r"[\d\.]+")
 
 
 class TerabyteScraper(BaseScraper):
@@ -98,10 +101,7 @@ class TerabyteScraper(BaseScraper):
                         )
                         # Usually the last number is the price if there are multiple or extra text
                         # But safely, let's find the float pattern
-                        import re
-
-                        matches = re.findall(
-                            r"[\d\.]+",
+                        matches = _NUMBER_RE.findall(
                             text.replace("R$", "").replace(".", "").replace(",", "."),
                         )
                         if matches:
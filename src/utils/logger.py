@@ -9,7 +9,7 @@ import sys
 from typing import Any, Dict
 
 import structlog
-from structlog.types import EventDict, Processor
+from structlog.types import EventDict, FilteringBoundLogger, Processor
 
 
 def add_app_context(
@@ -30,11 +30,13 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         json_logs: Whether to output JSON format (True) or console format (False)
     """
 
+    level = getattr(logging, log_level.upper())
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
     # Shared processors for all configurations
@@ -62,14 +64,15 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the level return at once, before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str) -> FilteringBoundLogger:
     """
     Get a configured logger instance
 
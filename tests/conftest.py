@@ -1,6 +1,5 @@
 """Test fixtures and configuration"""
 
-import pytest
 import os
 import sys
 
@@ -9,16 +8,10 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Setup test environment"""
-    # Set test environment variables
-    os.environ["APP_ENV"] = "testing"
-    os.environ["DB_URL"] = "sqlite:///:memory:"
-    os.environ["LOG_LEVEL"] = "DEBUG"
-
-    yield
-
-    # Cleanup
-    pass
+# Set test environment variables before any application module is imported:
+# the config singleton may already be built while tests are being collected
+os.environ["APP_ENV"] = "testing"
+# TEST_DB_URL points the suite at a persistent database; with REUSE_DB=1 its
+# schema is kept between runs instead of being created again
+os.environ["DB_URL"] = os.environ.get("TEST_DB_URL", "sqlite:///:memory:")
+os.environ["LOG_LEVEL"] = "DEBUG"
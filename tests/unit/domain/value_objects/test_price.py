@@ -1,9 +1,11 @@
 """Tests for Price value object."""
 
+import sys
+
 import pytest
 from decimal import Decimal
 
-from src.scrapers.domain.value_objects.price import Price
+from src.scrapers.domain.value_objects.price import Price, _WHITESPACE
 
 
 class TestPrice:
@@ -38,6 +40,9 @@ class TestPrice:
         with pytest.raises(ValueError, match="Currency cannot be empty"):
             Price(amount=Decimal("100"), currency="")
 
+        with pytest.raises(ValueError, match="Currency cannot be empty"):
+            Price(amount=Decimal("100"), currency="   ")
+
     def test_currency_must_be_3_letters(self):
         """Test that currency must be 3-letter code."""
         with pytest.raises(ValueError, match="must be 3-letter code"):
@@ -46,6 +51,19 @@ class TestPrice:
         with pytest.raises(ValueError, match="must be 3-letter code"):
             Price(amount=Decimal("100"), currency="USDD")
 
+        with pytest.raises(ValueError, match="must be 3-letter code"):
+            Price(amount=Decimal("100"), currency="US1")
+
+        with pytest.raises(ValueError, match="must be 3-letter code"):
+            Price(amount=Decimal("100"), currency="ÉUR")
+
+    def test_currency_is_normalized_to_uppercase(self):
+        """Test that currency code is stored uppercase."""
+        price = Price(amount=Decimal("100"), currency="usd")
+
+        assert price.currency == "USD"
+        assert price.currency is Price(amount=Decimal("1"), currency="USD").currency
+
     def test_from_string_brazilian_format(self):
         """Test parsing Brazilian price format."""
         price = Price.from_string("R$ 1.234,56")
@@ -54,6 +72,14 @@ class TestPrice:
         assert price.currency == "BRL"
         assert price.raw_string == "R$ 1.234,56"
 
+    def test_from_string_raw_string_is_shared(self):
+        """Test that equal raw strings share one string object."""
+        price1 = Price.from_string("".join(["R$ 1.234", ",56"]))
+        price2 = Price.from_string("".join(["R$ 1.23", "4,56"]))
+
+        assert price1.raw_string == "R$ 1.234,56"
+        assert price1.raw_string is price2.raw_string
+
     def test_from_string_us_format(self):
         """Test parsing US price format."""
         price = Price.from_string("1,234.56", currency="USD")
@@ -73,6 +99,18 @@ class TestPrice:
 
         assert price.amount == Decimal("1234.56")
 
+    def test_from_string_with_unicode_spaces(self):
+        """Test that thin, figure and ideographic spaces are ignored."""
+        assert Price.from_string("1\u2009234,56").amount == Decimal("1234.56")
+        assert Price.from_string("R$\u20071.234,56").amount == Decimal("1234.56")
+        assert Price.from_string("R$\u30001234,56").amount == Decimal("1234.56")
+
+    def test_stripped_whitespace_matches_isspace(self):
+        """Test that the stripped set is every str.isspace() character."""
+        expected = {chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace()}
+
+        assert set(_WHITESPACE) == expected
+
     def test_from_string_invalid_format(self):
         """Test that invalid format raises error."""
         with pytest.raises(ValueError, match="Cannot parse price"):
@@ -81,6 +119,14 @@ class TestPrice:
         with pytest.raises(ValueError, match="cannot be empty"):
             Price.from_string("")
 
+    def test_from_string_repeated_decimal_separator(self):
+        """Test that a repeated decimal separator raises error."""
+        with pytest.raises(ValueError, match="Cannot parse price"):
+            Price.from_string("1.234.56")
+
+        with pytest.raises(ValueError, match="Cannot parse price"):
+            Price.from_string("R$")
+
     def test_from_float(self):
         """Test creating price from float."""
         price = Price.from_float(1234.56, currency="USD")
@@ -131,6 +177,16 @@ class TestPrice:
         assert price1 > price2
         assert not price2 > price1
 
+    def test_price_comparison_or_equal(self):
+        """Test price less/greater than or equal comparisons."""
+        price1 = Price(amount=Decimal("100"), currency="BRL")
+        price2 = Price(amount=Decimal("100"), currency="BRL", raw_string="R$ 100")
+        price3 = Price(amount=Decimal("200"), currency="BRL")
+
+        assert price1 <= price2 <= price3
+        assert price3 >= price2 >= price1
+        assert not price3 <= price1
+
     def test_price_comparison_different_currencies_raises_error(self):
         """Test that comparing different currencies raises error."""
         price_brl = Price(amount=Decimal("100"), currency="BRL")
@@ -139,6 +195,9 @@ class TestPrice:
         with pytest.raises(ValueError, match="different currencies"):
             price_brl < price_usd
 
+        with pytest.raises(ValueError, match="different currencies"):
+            price_brl >= price_usd
+
     def test_price_equality(self):
         """Test price equality."""
         price1 = Price(amount=Decimal("100"), currency="BRL")
@@ -154,3 +213,9 @@ class TestPrice:
 
         with pytest.raises(Exception):  # FrozenInstanceError
             price.amount = Decimal("200")
+
+    def test_price_has_no_dict(self):
+        """Test that fields are stored in slots."""
+        price = Price(amount=Decimal("100"), currency="BRL")
+
+        assert not hasattr(price, "__dict__")
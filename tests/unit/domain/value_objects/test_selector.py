@@ -109,6 +109,13 @@ class TestSelectorSet:
         assert selector_set[1] == ".b"
         assert selector_set[2] == ".c"
 
+    def test_membership(self):
+        """Test checking if a selector is in the set."""
+        selector_set = SelectorSet(selectors=[".a", ".b"])
+
+        assert ".a" in selector_set
+        assert ".c" not in selector_set
+
     def test_selector_set_is_immutable(self):
         """Test that selector set is immutable."""
         selector_set = SelectorSet(selectors=[".product"])
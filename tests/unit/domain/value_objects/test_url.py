@@ -1,6 +1,7 @@
 """Tests for ProductUrl value object."""
 
 import pytest
+from dataclasses import asdict
 
 from src.scrapers.domain.value_objects.url import ProductUrl
 
@@ -51,6 +52,12 @@ class TestProductUrl:
 
         assert url1.normalized == url2.normalized
 
+    def test_url_normalization_removes_trailing_slash_before_params(self):
+        """Test that the trailing slash is removed before path params."""
+        url = ProductUrl("https://b.com/a/;p?q=1#frag")
+
+        assert url.normalized == "https://b.com/a;p?q=1"
+
     def test_url_normalization_lowercases_scheme_and_domain(self):
         """Test that normalization lowercases scheme and domain."""
         url = ProductUrl("HTTPS://EXAMPLE.COM/Product")
@@ -103,6 +110,24 @@ class TestProductUrl:
         url_set = {url1, url2}
         assert len(url_set) == 2
 
+    def test_url_hash_matches_equality(self):
+        """Test that equal URLs hash alike."""
+        url1 = ProductUrl("https://EXAMPLE.com:443/product/")
+        url2 = ProductUrl("https://example.com/product")
+
+        assert hash(url1) == hash(url2) == hash(url2.normalized)
+        assert len({url1, url2}) == 1
+
+    def test_url_asdict_after_hashing(self):
+        """Test that hashing adds nothing to the exported fields."""
+        url = ProductUrl("https://example.com/product/")
+        hash(url)
+
+        assert asdict(url) == {
+            "url": "https://example.com/product/",
+            "normalized": "https://example.com/product",
+        }
+
     def test_str_representation(self):
         """Test string representation."""
         url = ProductUrl("https://example.com/product")
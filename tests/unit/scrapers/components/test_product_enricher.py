@@ -129,6 +129,14 @@ class TestModelExtractor:
         result = ModelExtractor.extract("Generic Video Card")
         assert result == "Desconhecido"
 
+    def test_extract_shares_model_strings(self):
+        """Test that equal models are returned as one shared string."""
+        first = ModelExtractor.extract("ASUS RTX 4090 OC")
+        second = ModelExtractor.extract("MSI RTX4090")
+
+        assert first == "RTX 4090"
+        assert first is second
+
 
 class TestProductEnricher:
     """Test suite for ProductEnricher."""
@@ -174,3 +182,29 @@ class TestProductEnricher:
         assert chip == ChipBrand.OTHER
         assert manufacturer == "Genérica/Outra"
         assert model == "Desconhecido"
+
+    def test_enrich_batch_matches_enrich(self):
+        """Test that batch enrichment matches single enrichment."""
+        enricher = ProductEnricher()
+        titles = ["ASUS RTX 4090", "MSI RX 7900 XT", "ASUS RTX 4090", "Generic"]
+        urls = ["", "", "", "https://example.com/zotac-card-1"]
+
+        results = enricher.enrich_batch(titles, urls)
+
+        assert results == [enricher.enrich(t, u) for t, u in zip(titles, urls)]
+        assert enricher.enrich_batch(titles) == [enricher.enrich(t) for t in titles]
+
+    def test_enrich_batch_many_titles(self):
+        """Test enriching a large batch of repeated NVIDIA titles."""
+        enricher = ProductEnricher()
+
+        results = enricher.enrich_batch(["ASUS ROG RTX 4090"] * 100)
+
+        assert results == [(ChipBrand.NVIDIA, "ASUS", "RTX 4090")] * 100
+
+    def test_enrich_batch_length_mismatch(self):
+        """Test that titles and urls must be parallel."""
+        enricher = ProductEnricher()
+
+        with pytest.raises(ValueError, match="same length"):
+            enricher.enrich_batch(["RTX 4090"], [])
@@ -4,52 +4,98 @@ Unit tests for API endpoints
 Tests all API routes with mocked dependencies.
 """
 
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from unittest.mock import Mock, patch
+from dataclasses import dataclass
 from datetime import datetime
-
-from src.backend.api.app import create_app
+from types import SimpleNamespace
+from typing import Optional
+
+from src.backend.api.app import app as api_app
+from src.backend.api.dependencies import (
+    get_product_repository,
+    get_scraper_run_repository,
+)
+from src.backend.core.database import get_db
 from src.backend.core.models import ProductInDB, ChipBrand, Store, Price, ScraperMetrics
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    app = create_app()
-    return TestClient(app)
-
-
-@pytest.fixture
-def mock_db():
-    """Mock database session"""
-    return Mock()
+@pytest.fixture(scope="session")
+def app():
+    """Reuse the application built when src.backend.api.app is imported"""
+    return api_app
+
+
+@pytest_asyncio.fixture
+async def client(app):
+    """Create test client calling the ASGI app in-process on the test's loop"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def mock_repo(app):
+    """Inject one mocked repository through FastAPI dependency overrides"""
+    repo = Mock()
+    app.dependency_overrides[get_db] = lambda: Mock()
+    app.dependency_overrides[get_product_repository] = lambda: repo
+    app.dependency_overrides[get_scraper_run_repository] = lambda: repo
+    yield repo
+    app.dependency_overrides.clear()
+
+
+@dataclass
+class FakeRun:
+    """Stand-in for a ScraperRun row with the attributes the routes read"""
+
+    id: int
+    store: str
+    products_saved: int
+    products_found: int
+    products_skipped: int
+    pages_scraped: int
+    errors: int
+    captchas_detected: int
+    execution_time: float
+    success: bool
+    error_message: Optional[str]
+    started_at: datetime
+    finished_at: datetime
+
+
+# Shared by every API test; the endpoints only serialize it, never mutate it
+_SAMPLE_PRODUCT = ProductInDB(
+    id=1,
+    title="Placa de Vídeo ASUS ROG RTX 4090",
+    price=Price(raw="R$ 12.000,00", value=12000.0),
+    url="https://example.com/product/1",
+    store=Store.PICHAU,
+    chip_brand=ChipBrand.NVIDIA,
+    manufacturer="ASUS",
+    model="RTX 4090",
+    scraped_at=datetime.now(),
+    created_at=datetime.now(),
+    updated_at=datetime.now(),
+)
 
 
 @pytest.fixture
 def sample_product():
-    """Sample product for testing"""
-    return ProductInDB(
-        id=1,
-        title="Placa de Vídeo ASUS ROG RTX 4090",
-        price=Price(raw="R$ 12.000,00", value=12000.0),
-        url="https://example.com/product/1",
-        store=Store.PICHAU,
-        chip_brand=ChipBrand.NVIDIA,
-        manufacturer="ASUS",
-        model="RTX 4090",
-        scraped_at=datetime.now(),
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    """Sample product for testing (shared, the API tests only read it)"""
+    return _SAMPLE_PRODUCT
 
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
 
-    def test_health_check(self, client):
+    @pytest.mark.asyncio
+    async def test_health_check(self, client):
         """Test basic health check"""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -57,20 +103,16 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert data["version"] == "2.0.0"
 
-    @patch("src.backend.api.routes.health.get_db")
-    def test_detailed_health_check(self, mock_get_db, client, mock_db):
+    @pytest.mark.asyncio
+    async def test_detailed_health_check(self, client, mock_repo):
         """Test detailed health check"""
         # Mock database stats
-        mock_repo = Mock()
         mock_repo.get_stats.return_value = {
             "total_products": 100,
             "latest_scrape": "2024-01-26T12:00:00",
         }
 
-        with patch(
-            "src.backend.api.routes.health.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/health/detailed")
+        response = await client.get("/health/detailed")
 
         assert response.status_code == 200
         data = response.json()
@@ -82,98 +124,64 @@ class TestHealthEndpoints:
 class TestProductEndpoints:
     """Test product API endpoints"""
 
-    @patch("src.backend.api.routes.products.get_db")
-    def test_list_products(self, mock_get_db, client, mock_db, sample_product):
-        """Test listing products"""
-        mock_repo = Mock()
-        mock_repo.search.return_value = [sample_product]
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url,method",
+        [
+            ("/api/v1/products/", "search"),
+            ("/api/v1/products/search?query=RTX&chip_brand=NVIDIA", "search"),
+            ("/api/v1/products/best-deals?limit=10", "get_best_deals"),
+        ],
+    )
+    async def test_product_list_endpoints(
+        self, client, mock_repo, sample_product, url, method
+    ):
+        """Test listing, searching and best deals endpoints"""
+        getattr(mock_repo, method).return_value = [sample_product]
 
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/")
+        response = await client.get(url)
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert len(data) == 1
         assert data[0]["title"] == sample_product.title
         assert data[0]["price"] == 12000.0
-
-    @patch("src.backend.api.routes.products.get_db")
-    def test_search_products(self, mock_get_db, client, mock_db, sample_product):
-        """Test searching products"""
-        mock_repo = Mock()
-        mock_repo.search.return_value = [sample_product]
-
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/search?query=RTX&chip_brand=NVIDIA")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
         assert data[0]["chip_brand"] == "NVIDIA"
+        assert data[0]["scraped_at"] == sample_product.scraped_at.isoformat()
 
-    @patch("src.backend.api.routes.products.get_db")
-    def test_get_best_deals(self, mock_get_db, client, mock_db, sample_product):
-        """Test getting best deals"""
-        mock_repo = Mock()
-        mock_repo.get_best_deals.return_value = [sample_product]
-
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/best-deals?limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-
-    @patch("src.backend.api.routes.products.get_db")
-    def test_get_product_by_id(self, mock_get_db, client, mock_db, sample_product):
+    @pytest.mark.asyncio
+    async def test_get_product_by_id(self, client, mock_repo, sample_product):
         """Test getting product by ID"""
-        mock_repo = Mock()
         mock_repo.get_by_id.return_value = sample_product
 
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/1")
+        response = await client.get("/api/v1/products/1")
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == 1
         assert data["title"] == sample_product.title
 
-    @patch("src.backend.api.routes.products.get_db")
-    def test_get_product_not_found(self, mock_get_db, client, mock_db):
+    @pytest.mark.asyncio
+    async def test_get_product_not_found(self, client, mock_repo):
         """Test getting non-existent product"""
-        mock_repo = Mock()
         mock_repo.get_by_id.return_value = None
 
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/999")
+        response = await client.get("/api/v1/products/999")
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    @patch("src.backend.api.routes.products.get_db")
-    def test_get_stats(self, mock_get_db, client, mock_db):
+    @pytest.mark.asyncio
+    async def test_get_stats(self, client, mock_repo):
         """Test getting statistics"""
-        mock_repo = Mock()
         mock_repo.get_stats.return_value = {
             "total_products": 150,
             "by_store": {"Pichau": 50, "Kabum": 100},
             "avg_price": 5000.0,
         }
 
-        with patch(
-            "src.backend.api.routes.products.ProductRepository", return_value=mock_repo
-        ):
-            response = client.get("/api/v1/products/stats/overview")
+        response = await client.get("/api/v1/products/stats/overview")
 
         assert response.status_code == 200
         data = response.json()
@@ -184,10 +192,15 @@ class TestProductEndpoints:
 class TestScraperEndpoints:
     """Test scraper API endpoints"""
 
+    @pytest.fixture
+    def mock_get_scheduler(self):
+        """Patch the scheduler lookup used by the scraper routes"""
+        with patch("src.backend.api.routes.scrapers.get_scheduler") as get_scheduler:
+            yield get_scheduler
+
+    @pytest.mark.asyncio
     @patch("src.backend.api.routes.scrapers.run_scrapers_background")
-    @patch("src.backend.api.routes.scrapers.get_scheduler")
-    @patch("src.backend.api.routes.scrapers.get_db")
-    def test_run_scrapers(self, mock_get_db, mock_get_scheduler, mock_bg_task, client):
+    async def test_run_scrapers(self, mock_bg_task, client, mock_get_scheduler):
         """Test running scrapers"""
         # Mock scheduler
         mock_scheduler = Mock()
@@ -197,7 +210,7 @@ class TestScraperEndpoints:
         mock_scheduler.run_now.return_value = mock_metrics
         mock_get_scheduler.return_value = mock_scheduler
 
-        response = client.post(
+        response = await client.post(
             "/api/v1/scrapers/run", json={"stores": ["Pichau"], "headless": True}
         )
 
@@ -207,47 +220,42 @@ class TestScraperEndpoints:
         # Background task returns 0 immediately, actual results come later
         assert data["total_products_saved"] == 0
 
-    @patch("src.backend.api.routes.scrapers.get_scheduler")
-    def test_get_scraper_status(self, mock_get_scheduler, client):
+    @pytest.mark.asyncio
+    async def test_get_scraper_status(self, client, mock_get_scheduler):
         """Test getting scraper status"""
-        mock_scheduler = Mock()
-        mock_scheduler.scheduler.running = True
-        mock_scheduler.get_jobs.return_value = []
-        mock_get_scheduler.return_value = mock_scheduler
+        mock_get_scheduler.return_value = SimpleNamespace(
+            scheduler=SimpleNamespace(running=True), get_jobs=lambda: []
+        )
 
-        response = client.get("/api/v1/scrapers/status")
+        response = await client.get("/api/v1/scrapers/status")
 
         assert response.status_code == 200
         data = response.json()
         assert data["scheduler_running"] is True
         assert "active_jobs" in data
 
-    @patch("src.backend.api.routes.scrapers.get_db")
-    def test_get_scraper_history(self, mock_get_db, client):
+    @pytest.mark.asyncio
+    async def test_get_scraper_history(self, client, mock_repo):
         """Test getting scraper history"""
-        mock_repo = Mock()
-        mock_run = Mock()
-        mock_run.id = 1
-        mock_run.store = "Pichau"
-        mock_run.products_saved = 10
-        mock_run.products_found = 15
-        mock_run.products_skipped = 5
-        mock_run.pages_scraped = 2
-        mock_run.errors = 0
-        mock_run.captchas_detected = 0
-        mock_run.execution_time = 5.0
-        mock_run.success = True
-        mock_run.error_message = None
-        mock_run.started_at = datetime.now()
-        mock_run.finished_at = datetime.now()
+        mock_run = FakeRun(
+            id=1,
+            store="Pichau",
+            products_saved=10,
+            products_found=15,
+            products_skipped=5,
+            pages_scraped=2,
+            errors=0,
+            captchas_detected=0,
+            execution_time=5.0,
+            success=True,
+            error_message=None,
+            started_at=datetime.now(),
+            finished_at=datetime.now(),
+        )
 
         mock_repo.get_recent_runs.return_value = [mock_run]
 
-        with patch(
-            "src.backend.api.routes.scrapers.ScraperRunRepository",
-            return_value=mock_repo,
-        ):
-            response = client.get("/api/v1/scrapers/history")
+        response = await client.get("/api/v1/scrapers/history")
 
         assert response.status_code == 200
         data = response.json()
@@ -273,14 +281,16 @@ class TestAuthentication:
 class TestRateLimiting:
     """Test rate limiting"""
 
-    def test_rate_limit_not_exceeded(self, client):
+    @pytest.mark.asyncio
+    async def test_rate_limit_not_exceeded(self, client):
         """Test normal requests within rate limit"""
-        # Make a few requests
-        for _ in range(5):
-            response = client.get("/health")
-            assert response.status_code == 200
+        # Make a few concurrent requests
+        responses = await asyncio.gather(*(client.get("/health") for _ in range(5)))
+
+        assert [r.status_code for r in responses] == [200] * 5
 
-    def test_rate_limit_exceeded(self, client):
+    @pytest.mark.asyncio
+    async def test_rate_limit_exceeded(self, client):
         """Test rate limit enforcement"""
         # This would require many requests
         # Skipping for now as it's slow
@@ -16,22 +16,32 @@ from src.data.processors import (
 from src.backend.core.models import ProductInDB, RawProduct, Price, Store, ChipBrand
 
 
+# Validated once; the fixture hands out deep copies since processors mutate them
+_SAMPLE_PRODUCT = ProductInDB(
+    id=1,
+    title="Placa de Vídeo ASUS ROG RTX 4090 24GB",
+    price=Price(raw="R$ 12.000,00", value=Decimal("12000.00")),
+    url="https://pichau.com.br/produto/123",
+    store=Store.PICHAU,
+    chip_brand=ChipBrand.NVIDIA,
+    manufacturer="ASUS",
+    model="RTX 4090",
+    scraped_at=datetime.now(),
+    created_at=datetime.now(),
+    updated_at=datetime.now(),
+)
+
+
 @pytest.fixture
 def sample_product():
-    """Sample product for testing"""
-    return ProductInDB(
-        id=1,
-        title="Placa de Vídeo ASUS ROG RTX 4090 24GB",
-        price=Price(raw="R$ 12.000,00", value=Decimal("12000.00")),
-        url="https://pichau.com.br/produto/123",
-        store=Store.PICHAU,
-        chip_brand=ChipBrand.NVIDIA,
-        manufacturer="ASUS",
-        model="RTX 4090",
-        scraped_at=datetime.now(),
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    """Sample product for testing (a deep copy, tests may mutate it)"""
+    return _SAMPLE_PRODUCT.model_copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def enricher():
+    """One enricher for the module, it holds no per-product state"""
+    return DataEnricher()
 
 
 class TestDataCleaner:
@@ -66,6 +76,12 @@ class TestDataCleaner:
         assert DataCleaner.standardize_manufacturer("GIGA BYTE") == "GIGABYTE"
         assert DataCleaner.standardize_manufacturer("Unknown") == "Unknown"
 
+    def test_standardize_manufacturer_matches_variant_inside_name(self):
+        """Test that variants are found anywhere in the name"""
+        assert DataCleaner.standardize_manufacturer("Asus ROG Strix") == "ASUS"
+        assert DataCleaner.standardize_manufacturer("Galaxy") == "GALAX"
+        assert DataCleaner.standardize_manufacturer("") == ""
+
     def test_clean_product(self, sample_product):
         """Test cleaning full product"""
         # Add some dirty data
@@ -76,6 +92,8 @@ class TestDataCleaner:
 
         assert cleaned.title == "Placa RTX"
         assert cleaned.manufacturer == "ASUS"
+        assert cleaned.url == sample_product.url
+        assert sample_product.manufacturer == "AZUS"  # Input left untouched
 
     def test_remove_duplicates(self, sample_product):
         """Test duplicate removal"""
@@ -186,10 +204,8 @@ class TestDataValidator:
 class TestDataEnricher:
     """Test DataEnricher"""
 
-    def test_enrich_product(self):
+    def test_enrich_product(self, enricher):
         """Test product enrichment"""
-        enricher = DataEnricher()
-
         raw = RawProduct(
             title="Placa de Vídeo MSI GeForce RTX 4080",
             price=Price(raw="R$ 8.000,00", value=Decimal("8000.00")),
@@ -203,10 +219,8 @@ class TestDataEnricher:
         assert enriched.manufacturer == "MSI"
         assert "RTX 4080" in enriched.model
 
-    def test_enrich_batch(self):
+    def test_enrich_batch(self, enricher):
         """Test batch enrichment"""
-        enricher = DataEnricher()
-
         raw_products = [
             RawProduct(
                 title="ASUS RTX 4090",
@@ -227,6 +241,10 @@ class TestDataEnricher:
         assert len(enriched) == 2
         assert enriched[0].chip_brand == ChipBrand.NVIDIA
         assert enriched[1].chip_brand == ChipBrand.AMD
+        assert [(e.chip_brand, e.manufacturer, e.model) for e in enriched] == [
+            (e.chip_brand, e.manufacturer, e.model)
+            for e in map(enricher.enrich_product, raw_products)
+        ]
 
 
 if __name__ == "__main__":
@@ -4,12 +4,17 @@ Unit tests for database layer
 Tests models, repository, and database operations.
 """
 
+import os
 import pytest
 from datetime import datetime
 from decimal import Decimal
 
 from src.backend.core.models import Price, RawProduct, EnrichedProduct, ChipBrand, Store
-from src.backend.core.database import create_tables, get_db_session
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.backend.core.database import create_tables, get_engine
+from src.backend.core.database_models import Product
 from src.backend.core.repository import ProductRepository
 
 
@@ -74,16 +79,64 @@ class TestProductModels:
         assert isinstance(product.scraped_at, datetime)
 
 
-@pytest.fixture
-def db_session():
-    """Fixture to provide database session for tests"""
-    # Create tables
+def _in_memory(engine) -> bool:
+    """Whether the engine points at an in-memory SQLite database"""
+    return engine.url.get_backend_name() == "sqlite" and engine.url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """
+    Create tables once for the whole test session
+
+    With REUSE_DB=1 and a persistent TEST_DB_URL the schema left by an
+    earlier run is used as is, so the first run against a new database must
+    be made without the flag. Every test rolls back, so it stays empty.
+    """
+    if os.environ.get("REUSE_DB") == "1" and not _in_memory(get_engine()):
+        return
+
     create_tables()
 
-    # Provide session
-    with get_db_session() as session:
-        yield session
-        # Cleanup happens automatically
+
+@pytest.fixture
+def db_session(db_schema):
+    """Fixture to provide a database session rolled back after each test"""
+    connection = get_engine().connect()
+
+    # pysqlite starts transactions lazily and would turn the session's
+    # savepoints into real commits; hand transaction control to SQLAlchemy
+    dbapi_connection = connection.connection.dbapi_connection
+    isolation_level = dbapi_connection.isolation_level
+    dbapi_connection.isolation_level = None
+
+    transaction = connection.begin()
+    connection.exec_driver_sql("BEGIN")
+
+    # session.commit() only releases a SAVEPOINT inside the outer transaction
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    dbapi_connection.isolation_level = isolation_level
+    connection.close()
+
+
+class TestEngine:
+    """Test engine configuration"""
+
+    def test_in_memory_engine_shares_one_connection(self):
+        """Test that in-memory SQLite is shared across threads"""
+        if not _in_memory(get_engine()):
+            pytest.skip("TEST_DB_URL points at a persistent database")
+
+        assert isinstance(get_engine().pool, StaticPool)
 
 
 class TestProductRepository:
@@ -145,16 +198,66 @@ class TestProductRepository:
         assert saved2.title == "Product V2"
         assert float(saved2.price.value) == 900.0
 
-    def test_get_best_deals(self, db_session):
-        """Test getting best deals"""
+    @pytest.mark.parametrize("run", [1, 2])
+    def test_committed_data_is_rolled_back(self, db_session, run):
+        """Test that commits inside a test do not leak into the next one"""
         repo = ProductRepository(db_session)
 
-        # Clear any existing products to ensure test isolation
-        from src.backend.core.database_models import Product
+        existing = db_session.query(Product).filter_by(
+            url="https://example.com/rollback"
+        )
+        assert existing.count() == 0
 
-        db_session.query(Product).delete()
+        product = EnrichedProduct(
+            title="Rollback",
+            price=Price.from_string("R$ 1.000,00"),
+            url="https://example.com/rollback",
+            store=Store.KABUM,
+            chip_brand=ChipBrand.AMD,
+            manufacturer="XFX",
+            model="RX 7600",
+        )
+        repo.create(product)
         db_session.commit()
 
+    def test_create_many_matches_create(self, db_session):
+        """Test bulk create keeps create()'s upsert-by-URL semantics"""
+        repo = ProductRepository(db_session)
+
+        def product(title, price, url):
+            return EnrichedProduct(
+                title=title,
+                price=Price.from_string(price),
+                url=url,
+                store=Store.PICHAU,
+                chip_brand=ChipBrand.NVIDIA,
+                manufacturer="ASUS",
+                model="RTX 4070",
+            )
+
+        existing = repo.create(
+            product("Product Old", "R$ 3.000,00", "https://example.com/a")
+        )
+
+        saved = repo.create_many(
+            [
+                product("Product A", "R$ 2.000,00", "https://example.com/a"),
+                product("Product B", "R$ 2.500,00", "https://example.com/b"),
+                product("Product B2", "R$ 2.400,00", "https://example.com/b"),
+            ]
+        )
+
+        # A URL repeated in the batch ends up as one row holding the last values
+        assert [p.title for p in saved] == ["Product A", "Product B2", "Product B2"]
+        assert saved[0].id == existing.id
+        assert saved[1].id == saved[2].id
+        assert float(saved[2].price.value) == 2400.0
+        assert db_session.query(Product).count() == 2
+
+    def test_get_best_deals(self, db_session):
+        """Test getting best deals"""
+        repo = ProductRepository(db_session)
+
         # Create multiple products
         products = [
             EnrichedProduct(
@@ -169,8 +272,7 @@ class TestProductRepository:
             for i in range(5)
         ]
 
-        for p in products:
-            repo.create(p)
+        repo.create_many(products)
 
         # Get best deals
         best = repo.get_best_deals(limit=3)
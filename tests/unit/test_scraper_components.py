@@ -4,6 +4,9 @@ Unit tests for scraper components
 Tests the reusable scraper components.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 
@@ -218,6 +221,18 @@ class TestSelectorCache:
 
         assert result == "h2.product-title"
 
+    def test_manual_set_falsy_selector_is_a_hit(self):
+        """Test that any cached value is returned as is, not re-probed"""
+        cache = SelectorCache()
+
+        cache.set("title", "")
+        cache.set("price", None)
+
+        assert cache.get("title", ["h1"], test_func=lambda selector: True) == ""
+        assert cache.get("price", ["span"], test_func=lambda selector: True) is None
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 0
+
     def test_clear_cache(self):
         """Test clearing cache"""
         cache = SelectorCache()
@@ -229,6 +244,34 @@ class TestSelectorCache:
         assert stats["cached_selectors"] == 0
         assert stats["hits"] == 0
 
+    def test_concurrent_misses_probe_once(self):
+        """Test that threads missing the same key probe selectors once"""
+        cache = SelectorCache()
+        probed = []
+
+        def test_func(selector):
+            probed.append(selector)
+            time.sleep(0.01)
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda _: cache.get("price", ["div.price"], test_func), range(8)
+                )
+            )
+
+        assert results == ["div.price"] * 8
+        assert probed == ["div.price"]
+        assert cache.get_stats()["misses"] == 1
+
+    def test_instances_have_no_dict(self):
+        """Test that cache and enricher instances use slots"""
+        cache = SelectorCache()
+
+        assert not hasattr(cache, "__dict__")
+        assert not hasattr(ProductEnricher(), "__dict__")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])